@@ -1,19 +1,49 @@
 from fastapi import FastAPI, HTTPException, Query, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response
 from pydantic import BaseModel
 from typing import List, Optional
+from cashews import cache
+from contextlib import asynccontextmanager
+import hashlib
 import httpx
+import json
 import os
 from dotenv import load_dotenv
 
+# orjson is optional; the stdlib json module is used when it is missing
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Load environment variables
 load_dotenv()
 
+# Response cache: in-process by default, Redis when CACHE_URL=redis://...
+CACHE_TTL_SECONDS = int(os.getenv('CACHE_TTL_SECONDS', '300'))
+cache.setup(os.getenv('CACHE_URL', 'mem://'))
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Create shared clients at startup and release them on shutdown"""
+    # Pooled HTTP client for outbound calls from request handlers
+    app.state.http_client = httpx.AsyncClient(
+        http2=True,
+        limits=httpx.Limits(max_keepalive_connections=50),
+        timeout=30.0
+    )
+    try:
+        yield
+    finally:
+        await app.state.http_client.aclose()
+        await cache.close()
+
 app = FastAPI(
     title="Patent Development API",
     description="AI-powered patent search and analysis platform",
-    version="0.1.0"
+    version="0.1.0",
+    lifespan=lifespan
 )
 
 # Configure CORS
@@ -44,6 +74,28 @@ class SearchResponse(BaseModel):
     total_count: int
     query: str
 
+# Placeholder search results; {q} is filled in with the search query
+MOCK_SEARCH_RESULTS = [
+    {
+        "id": "US10123456",
+        "title": "Advanced Patent Technology Related to: {q}",
+        "abstract": "This patent describes innovative approaches to {q} with applications in various technological domains.",
+        "inventors": ["John Doe", "Jane Smith"],
+        "assignee": "Tech Corp Inc.",
+        "publication_date": "2023-01-15",
+        "patent_number": "US10123456B2"
+    },
+    {
+        "id": "US10234567",
+        "title": "System and Method for {q} Processing",
+        "abstract": "A comprehensive system for implementing {q} with enhanced performance characteristics.",
+        "inventors": ["Alice Johnson"],
+        "assignee": "Innovation Labs",
+        "publication_date": "2023-02-20",
+        "patent_number": "US10234567B1"
+    }
+]
+
 # API Routes
 @app.get("/")
 async def root():
@@ -60,8 +112,46 @@ async def health_check():
     """Health check endpoint"""
     return {"status": "healthy", "service": "patent-api"}
 
+def dumps_json(data) -> bytes:
+    """Serialize data to compact UTF-8 JSON bytes"""
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+def cached_json_response(body: bytes, request: Request) -> Response:
+    """Serve pre-serialized JSON with HTTP caching headers, honouring If-None-Match"""
+    etag = f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+    headers = {
+        "Cache-Control": f"public, max-age={CACHE_TTL_SECONDS}",
+        "ETag": etag
+    }
+    
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+    
+    return Response(content=body, media_type="application/json", headers=headers)
+
+@cache(ttl=CACHE_TTL_SECONDS, key="search:{q}:{limit}")
+async def search_body(q: str, limit: int) -> bytes:
+    """Run a patent search and return the serialized SearchResponse"""
+    # TODO: Implement actual patent search logic
+    # This is a placeholder implementation
+    
+    # For now, return mock data built from the module-level template
+    results = [
+        {**template, "title": template["title"].format(q=q), "abstract": template["abstract"].format(q=q)}
+        for template in MOCK_SEARCH_RESULTS[:limit]
+    ]
+    
+    return dumps_json({
+        "results": results,
+        "total_count": len(results),
+        "query": q
+    })
+
 @app.get("/search", response_model=SearchResponse)
 async def search_patents(
+    request: Request,
     q: str = Query(..., description="Search query for patents"),
     limit: int = Query(10, ge=1, le=100, description="Number of results to return")
 ):
@@ -72,61 +162,34 @@ async def search_patents(
     - **limit**: Maximum number of results to return (1-100)
     """
     try:
-        # TODO: Implement actual patent search logic
-        # This is a placeholder implementation
-        
-        # For now, return mock data
-        mock_results = [
-            PatentResult(
-                id="US10123456",
-                title=f"Advanced Patent Technology Related to: {q}",
-                abstract=f"This patent describes innovative approaches to {q} with applications in various technological domains.",
-                inventors=["John Doe", "Jane Smith"],
-                assignee="Tech Corp Inc.",
-                publication_date="2023-01-15",
-                patent_number="US10123456B2"
-            ),
-            PatentResult(
-                id="US10234567",
-                title=f"System and Method for {q} Processing",
-                abstract=f"A comprehensive system for implementing {q} with enhanced performance characteristics.",
-                inventors=["Alice Johnson"],
-                assignee="Innovation Labs",
-                publication_date="2023-02-20",
-                patent_number="US10234567B1"
-            )
-        ]
-        
-        # Limit results based on the limit parameter
-        limited_results = mock_results[:limit]
-        
-        return SearchResponse(
-            results=limited_results,
-            total_count=len(limited_results),
-            query=q
-        )
+        return cached_json_response(await search_body(q, limit), request)
         
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Search failed: {str(e)}")
 
 @app.post("/search", response_model=SearchResponse)
-async def search_patents_post(request: PatentSearchRequest):
+async def search_patents_post(search_request: PatentSearchRequest, request: Request):
     """
     Search for patents using POST method with request body
     """
-    return await search_patents(q=request.query, limit=request.limit)
+    return await search_patents(request, q=search_request.query, limit=search_request.limit)
 
-@app.get("/patent/{patent_id}")
-async def get_patent_details(patent_id: str):
-    """
-    Get detailed information about a specific patent
-    """
+@cache(ttl=CACHE_TTL_SECONDS, key="patent:{patent_id}")
+async def patent_details_body(patent_id: str) -> bytes:
+    """Look up a patent and return the serialized details"""
     # TODO: Implement patent detail retrieval
-    return {
+    return dumps_json({
         "patent_id": patent_id,
         "title": f"Patent {patent_id} Details",
         "status": "placeholder - not yet implemented"
-    }
+    })
+
+@app.get("/patent/{patent_id}")
+async def get_patent_details(patent_id: str, request: Request):
+    """
+    Get detailed information about a specific patent
+    """
+    return cached_json_response(await patent_details_body(patent_id), request)
 
 # Error handlers
 @app.exception_handler(404)
@@ -8,33 +8,125 @@ including government patent databases, API endpoints, and file uploads.
 import asyncio
 import json
 import csv
+import logging
+import logging.handlers
+import queue
+import re
+from collections import deque
 from pathlib import Path
-from typing import List, Dict, Optional, Union
-from datetime import datetime
+from typing import List, Dict, Iterable, Iterator, Optional, Union
+from datetime import date, datetime
 import httpx
 from google.cloud import bigquery
-import pandas as pd
 from dotenv import load_dotenv
 import os
 
+# orjson is optional; the stdlib json module is used when it is missing
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# pyarrow is optional; when present it is used for streaming CSV parsing and Parquet ingestion
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.csv as pacsv
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+    pc = None
+    pacsv = None
+    pq = None
+
+# The BigQuery Storage Write API client is optional; load jobs are used without it
+try:
+    from google.cloud.bigquery_storage_v1 import BigQueryWriteClient
+    from google.cloud.bigquery_storage_v1 import exceptions as bqstorage_exceptions
+    from google.cloud.bigquery_storage_v1 import types as bqstorage_types
+    from google.cloud.bigquery_storage_v1 import writer as bqstorage_writer
+except ImportError:
+    BigQueryWriteClient = None
+
 # Load environment variables
 load_dotenv()
 
+logger = logging.getLogger(__name__)
+
+# Background listener started by configure_logging
+_log_listener: Optional[logging.handlers.QueueListener] = None
+
+# Maximum number of rows submitted per BigQuery load job
+BIGQUERY_LOAD_BATCH_SIZE = 10_000
+
+# Non-ISO date layouts accepted by PatentIngestor._clean_date
+_DATE_RE = re.compile(r'^(?:(\d{4})-(\d{1,2})-(\d{1,2})(?: (\d{1,2}):(\d{1,2}):(\d{1,2}))?|(\d{1,2})/(\d{1,2})/(\d{4}))$')
+
+# Rows per AppendRows request sent through the Storage Write API
+STORAGE_WRITE_BATCH_SIZE = 500
+
+# Maximum number of AppendRows requests awaiting acknowledgement
+STORAGE_WRITE_MAX_IN_FLIGHT = 16
+
+# Maximum number of sources ingested concurrently by ingest_patent_batch
+MAX_CONCURRENT_SOURCES = 8
+
+# Rows per batch yielded when streaming CSV files
+CSV_BATCH_SIZE = 100_000
+
+# Rows per record batch read from Parquet files
+PARQUET_BATCH_SIZE = 64_000
+
+# Raw patent fields read from Parquet files; other columns are skipped
+PATENT_SOURCE_COLUMNS = (
+    'id', 'title', 'abstract', 'inventors', 'assignee', 'publication_date',
+    'patent_number', 'classification_codes', 'claims'
+)
+
+# Bytes per block read by the pyarrow CSV reader
+CSV_BLOCK_SIZE = 64 << 20
+
 class PatentIngestor:
     """Main class for patent data ingestion and processing"""
     
     def __init__(self):
         self.bigquery_client = None
+        self.write_client = None
         self.dataset_id = os.getenv('BIGQUERY_DATASET_ID')
         self.project_id = os.getenv('GOOGLE_CLOUD_PROJECT_ID')
+        # Shared HTTP client for API ingestion, created on first use
+        self._http_client: Optional[httpx.AsyncClient] = None
         
         # Initialize BigQuery client if credentials are available
         if self.project_id:
             try:
                 self.bigquery_client = bigquery.Client(project=self.project_id)
-                print(f"BigQuery client initialized for project: {self.project_id}")
+                logger.info("BigQuery client initialized for project: %s", self.project_id)
             except Exception as e:
-                print(f"Warning: Could not initialize BigQuery client: {e}")
+                logger.warning("Could not initialize BigQuery client: %s", e)
+            
+            # Storage Write API appends need both the client library and pyarrow
+            if self.bigquery_client and BigQueryWriteClient is not None and pa is not None:
+                try:
+                    self.write_client = BigQueryWriteClient()
+                except Exception as e:
+                    logger.warning("Could not initialize BigQuery Storage Write client: %s", e)
+    
+    async def _get_client(self) -> httpx.AsyncClient:
+        """Return the shared HTTP client, creating it on first use"""
+        if self._http_client is None:
+            self._http_client = httpx.AsyncClient(
+                http2=True,
+                limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+                timeout=30.0
+            )
+        return self._http_client
+    
+    async def aclose(self):
+        """Close the shared HTTP client"""
+        if self._http_client is not None:
+            await self._http_client.aclose()
+            self._http_client = None
     
     async def ingest_from_api(self, api_url: str, headers: Dict = None) -> List[Dict]:
         """
@@ -48,16 +140,16 @@ class PatentIngestor:
             List of patent dictionaries
         """
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(api_url, headers=headers or {})
-                response.raise_for_status()
-                
-                data = response.json()
-                print(f"Successfully ingested {len(data)} patents from API")
-                return data
-                
+            client = await self._get_client()
+            response = await client.get(api_url, headers=headers or {})
+            response.raise_for_status()
+            
+            data = response.json()
+            logger.info("Successfully ingested %d patents from API", len(data))
+            return data
+            
         except Exception as e:
-            print(f"Error ingesting from API: {e}")
+            logger.error("Error ingesting from API: %s", e)
             return []
     
     def ingest_from_csv(self, file_path: Union[str, Path]) -> List[Dict]:
@@ -70,22 +162,135 @@ class PatentIngestor:
         Returns:
             List of patent dictionaries
         """
+        patents = []
+        for batch in self.iter_from_csv(file_path):
+            patents.extend(batch)
+        return patents
+    
+    def iter_from_csv(self, file_path: Union[str, Path], batch_size: int = CSV_BATCH_SIZE,
+                      arrow: bool = False) -> Iterator[Union[List[Dict], 'pa.RecordBatch']]:
+        """
+        Stream patent data from a CSV file in batches
+        
+        Uses pyarrow's streaming CSV reader when available and falls back to
+        the standard library csv module otherwise. All values are read as strings.
+        The pyarrow reader logs and skips rows with the wrong number of columns.
+        
+        Args:
+            file_path: Path to the CSV file
+            batch_size: Maximum number of rows per batch (stdlib reader only;
+                pyarrow batches follow CSV_BLOCK_SIZE)
+            arrow: Yield pyarrow RecordBatches instead of dictionaries when
+                pyarrow is installed
+            
+        Yields:
+            Lists of patent dictionaries, or RecordBatches when arrow is set
+        """
+        total = 0
         try:
             file_path = Path(file_path)
             if not file_path.exists():
                 raise FileNotFoundError(f"CSV file not found: {file_path}")
             
-            patents = []
-            with open(file_path, 'r', encoding='utf-8') as csvfile:
-                reader = csv.DictReader(csvfile)
-                patents = list(reader)
+            if pacsv is not None:
+                batches = self._iter_csv_pyarrow(file_path, arrow)
+            else:
+                batches = self._iter_csv_stdlib(file_path, batch_size)
             
-            print(f"Successfully ingested {len(patents)} patents from CSV")
-            return patents
+            for batch in batches:
+                total += len(batch)
+                yield batch
+            
+            logger.info("Successfully ingested %d patents from CSV", total)
             
         except Exception as e:
-            print(f"Error ingesting from CSV: {e}")
-            return []
+            logger.error("Error ingesting from CSV: %s", e)
+    
+    def _iter_csv_pyarrow(self, file_path: Path, arrow: bool = False) -> Iterator[Union[List[Dict], 'pa.RecordBatch']]:
+        """Stream CSV record batches with pyarrow, keeping every column as a string"""
+        # pyarrow drops a leading BOM from column names, so the header read here must too
+        with open(file_path, 'r', encoding='utf-8-sig', newline='') as csvfile:
+            header = next(csv.reader(csvfile), [])
+        
+        def skip_invalid_row(row):
+            logger.warning(
+                "Skipping CSV row %s in %s: expected %d columns, got %d",
+                row.number, file_path, row.expected_columns, row.actual_columns
+            )
+            return 'skip'
+        
+        reader = pacsv.open_csv(
+            file_path,
+            read_options=pacsv.ReadOptions(block_size=CSV_BLOCK_SIZE, use_threads=True),
+            # Abstracts and claims often hold quoted multi-line values
+            parse_options=pacsv.ParseOptions(newlines_in_values=True, invalid_row_handler=skip_invalid_row),
+            convert_options=pacsv.ConvertOptions(column_types={name: pa.string() for name in header})
+        )
+        for record_batch in reader:
+            yield record_batch if arrow else record_batch.to_pylist()
+    
+    def _iter_csv_stdlib(self, file_path: Path, batch_size: int) -> Iterator[List[Dict]]:
+        """Stream CSV rows with the standard library reader in fixed-size batches"""
+        with open(file_path, 'r', encoding='utf-8', newline='') as csvfile:
+            reader = csv.DictReader(csvfile)
+            batch = []
+            for row in reader:
+                batch.append(row)
+                if len(batch) >= batch_size:
+                    yield batch
+                    batch = []
+            if batch:
+                yield batch
+    
+    def ingest_from_parquet(self, file_path: Union[str, Path]) -> List[Dict]:
+        """
+        Ingest patent data from Parquet file
+        
+        Args:
+            file_path: Path to the Parquet file
+            
+        Returns:
+            List of patent dictionaries
+        """
+        patents = []
+        for batch in self.iter_from_parquet(file_path):
+            patents.extend(batch.to_pylist())
+        return patents
+    
+    def iter_from_parquet(self, file_path: Union[str, Path], batch_size: int = PARQUET_BATCH_SIZE) -> Iterator['pa.RecordBatch']:
+        """
+        Stream patent data from a Parquet file as pyarrow RecordBatches
+        
+        Only the columns in PATENT_SOURCE_COLUMNS are read.
+        
+        Args:
+            file_path: Path to the Parquet file
+            batch_size: Maximum number of rows per batch
+            
+        Yields:
+            RecordBatches of raw patent rows
+        """
+        total = 0
+        try:
+            if pq is None:
+                raise ImportError("pyarrow is required for Parquet ingestion")
+            
+            file_path = Path(file_path)
+            if not file_path.exists():
+                raise FileNotFoundError(f"Parquet file not found: {file_path}")
+            
+            parquet_file = pq.ParquetFile(file_path)
+            available = set(parquet_file.schema_arrow.names)
+            columns = [name for name in PATENT_SOURCE_COLUMNS if name in available]
+            
+            for batch in parquet_file.iter_batches(batch_size=batch_size, columns=columns):
+                total += batch.num_rows
+                yield batch
+            
+            logger.info("Successfully ingested %d patents from Parquet", total)
+            
+        except Exception as e:
+            logger.error("Error ingesting from Parquet: %s", e)
     
     def ingest_from_json(self, file_path: Union[str, Path]) -> List[Dict]:
         """
@@ -102,8 +307,11 @@ class PatentIngestor:
             if not file_path.exists():
                 raise FileNotFoundError(f"JSON file not found: {file_path}")
             
-            with open(file_path, 'r', encoding='utf-8') as jsonfile:
-                data = json.load(jsonfile)
+            if orjson is not None:
+                data = orjson.loads(file_path.read_bytes())
+            else:
+                with open(file_path, 'r', encoding='utf-8') as jsonfile:
+                    data = json.load(jsonfile)
             
             # Handle both single dict and list of dicts
             if isinstance(data, dict):
@@ -113,11 +321,11 @@ class PatentIngestor:
             else:
                 raise ValueError("JSON must contain a dictionary or list of dictionaries")
             
-            print(f"Successfully ingested {len(patents)} patents from JSON")
+            logger.info("Successfully ingested %d patents from JSON", len(patents))
             return patents
             
         except Exception as e:
-            print(f"Error ingesting from JSON: {e}")
+            logger.error("Error ingesting from JSON: %s", e)
             return []
     
     def clean_patent_data(self, patents: List[Dict]) -> List[Dict]:
@@ -131,6 +339,8 @@ class PatentIngestor:
             List of cleaned patent dictionaries
         """
         cleaned_patents = []
+        # One timestamp for the whole batch
+        ingested_at = datetime.utcnow().isoformat()
         
         for patent in patents:
             try:
@@ -144,22 +354,128 @@ class PatentIngestor:
                     'patent_number': patent.get('patent_number', '').strip(),
                     'classification_codes': patent.get('classification_codes', []),
                     'claims': patent.get('claims', []),
-                    'ingested_at': datetime.utcnow().isoformat()
+                    'ingested_at': ingested_at
                 }
                 
                 # Only add patents with minimum required fields
                 if cleaned_patent['id'] and cleaned_patent['title']:
                     cleaned_patents.append(cleaned_patent)
                 else:
-                    print(f"Skipping patent with missing required fields: {patent}")
+                    logger.warning("Skipping patent with missing required fields: %s", patent)
                     
             except Exception as e:
-                print(f"Error cleaning patent data: {e}, Patent: {patent}")
+                logger.error("Error cleaning patent data: %s, Patent: %s", e, patent)
                 continue
         
-        print(f"Cleaned {len(cleaned_patents)} patents out of {len(patents)} raw patents")
+        logger.info("Cleaned %d patents out of %d raw patents", len(cleaned_patents), len(patents))
+        return cleaned_patents
+    
+    def clean_patent_table(self, table: Union['pa.Table', 'pa.RecordBatch']) -> List[Dict]:
+        """
+        Clean and standardize patent data held in a pyarrow Table or RecordBatch
+        
+        Whitespace trimming, inventor filtering and the required-field check run
+        as pyarrow.compute kernels over whole columns; for non-null values the
+        output matches clean_patent_data. Null text fields become '' here,
+        whereas clean_patent_data fails on them and skips the row. Tables whose
+        text columns are not strings (or lists of strings for inventors) are
+        cleaned row by row instead.
+        
+        Args:
+            table: Raw patent rows
+            
+        Returns:
+            List of cleaned patent dictionaries
+        """
+        if isinstance(table, pa.RecordBatch):
+            table = pa.Table.from_batches([table])
+        
+        if not self._is_cleanable_table(table):
+            return self.clean_patent_data(table.to_pylist())
+        
+        num_rows = table.num_rows
+        if num_rows == 0:
+            # pa.repeat cannot build the default list columns for zero rows
+            return []
+        
+        def column(name, default):
+            if name in table.column_names:
+                return table[name].combine_chunks()
+            return pa.repeat(default, num_rows)
+        
+        def trimmed(name):
+            # Cast first so all-null (pa.null()) columns can take the '' fill
+            return pc.utf8_trim_whitespace(column(name, '').cast(pa.string()).fill_null(''))
+        
+        ids = trimmed('id')
+        titles = trimmed('title')
+        cleaned = pa.table({
+            'id': ids,
+            'title': titles,
+            'abstract': trimmed('abstract'),
+            'inventors': self._clean_inventor_column(column('inventors', pa.scalar([], pa.list_(pa.string())))),
+            'assignee': trimmed('assignee'),
+            'publication_date': pa.array(
+                [self._clean_date(value) for value in column('publication_date', None).to_pylist()],
+                type=pa.string()
+            ),
+            'patent_number': trimmed('patent_number'),
+            'classification_codes': column('classification_codes', pa.scalar([], pa.list_(pa.string()))),
+            'claims': column('claims', pa.scalar([], pa.list_(pa.string()))),
+            'ingested_at': pa.repeat(datetime.utcnow().isoformat(), num_rows)
+        })
+        
+        # Only keep patents with minimum required fields
+        keep = pc.and_(pc.not_equal(ids, ''), pc.not_equal(titles, ''))
+        cleaned_patents = cleaned.filter(keep).to_pylist()
+        
+        skipped = num_rows - len(cleaned_patents)
+        if skipped:
+            logger.warning("Skipping %d patents with missing required fields", skipped)
+        logger.info("Cleaned %d patents out of %d raw patents", len(cleaned_patents), num_rows)
         return cleaned_patents
     
+    def _is_cleanable_table(self, table: 'pa.Table') -> bool:
+        """Check that text columns have types the pyarrow.compute cleaning path supports"""
+        schema = table.schema
+        
+        def is_text(data_type):
+            return pa.types.is_string(data_type) or pa.types.is_large_string(data_type) or pa.types.is_null(data_type)
+        
+        for name in ('id', 'title', 'abstract', 'assignee', 'patent_number'):
+            if name in schema.names and not is_text(schema.field(name).type):
+                return False
+        
+        if 'inventors' in schema.names:
+            data_type = schema.field('inventors').type
+            if pa.types.is_list(data_type) or pa.types.is_large_list(data_type):
+                return is_text(data_type.value_type)
+            return is_text(data_type)
+        
+        return True
+    
+    def _clean_inventor_column(self, inventors: 'pa.Array') -> 'pa.ListArray':
+        """Vectorized equivalent of _clean_inventors over a string or list<string> column"""
+        if pa.types.is_list(inventors.type) or pa.types.is_large_list(inventors.type):
+            values = inventors.flatten()
+            lengths = pc.list_value_length(inventors).fill_null(0)
+        else:
+            # A single inventor string becomes a one-element list; every row keeps
+            # its slot in values, and the keep mask below drops nulls and blanks
+            values = inventors
+            lengths = pa.repeat(1, len(inventors))
+        
+        values = pc.utf8_trim_whitespace(values.cast(pa.string()))
+        keep = pc.and_(pc.is_valid(values), pc.not_equal(values, '')).fill_null(False)
+        
+        # Rebuild list offsets from a running count of the values that survive
+        zero = pa.array([0], pa.int64())
+        offsets = pa.concat_arrays([zero, pc.cumulative_sum(lengths.cast(pa.int64()))])
+        kept_before = pa.concat_arrays([zero, pc.cumulative_sum(keep.cast(pa.int64()))])
+        new_offsets = pc.take(kept_before, offsets).cast(pa.int32())
+        
+        return pa.ListArray.from_arrays(new_offsets, values.filter(keep))
+    
     def _clean_inventors(self, inventors) -> List[str]:
         """Clean and standardize inventor names"""
         if isinstance(inventors, str):
@@ -180,13 +496,31 @@ class PatentIngestor:
                 # Remove any extra whitespace
                 date_value = date_value.strip()
                 
-                # Try parsing common formats
-                for fmt in ['%Y-%m-%d', '%m/%d/%Y', '%d/%m/%Y', '%Y-%m-%d %H:%M:%S']:
-                    try:
-                        parsed_date = datetime.strptime(date_value, fmt)
-                        return parsed_date.strftime('%Y-%m-%d')
-                    except ValueError:
-                        continue
+                # Fast path for ISO dates, with or without a time component
+                try:
+                    return date.fromisoformat(date_value).isoformat()
+                except ValueError:
+                    pass
+                try:
+                    return datetime.fromisoformat(date_value).date().isoformat()
+                except ValueError:
+                    pass
+                
+                # Unpadded ISO dates and MM/DD/YYYY, falling back to DD/MM/YYYY
+                match = _DATE_RE.match(date_value)
+                if match:
+                    iso_year, iso_month, iso_day, hour, minute, second, first, other, year = match.groups()
+                    if iso_year:
+                        candidates = [(iso_year, iso_month, iso_day)]
+                    else:
+                        candidates = [(year, first, other), (year, other, first)]
+                    time_parts = [int(part) for part in (hour, minute, second) if part]
+                    for y, m, d in candidates:
+                        try:
+                            # An out-of-range time makes the whole value unparseable
+                            return datetime(int(y), int(m), int(d), *time_parts).date().isoformat()
+                        except ValueError:
+                            continue
             
             return str(date_value)
             
@@ -205,39 +539,219 @@ class PatentIngestor:
             True if successful, False otherwise
         """
         if not self.bigquery_client or not self.dataset_id:
-            print("BigQuery client not configured. Skipping BigQuery save.")
+            logger.warning("BigQuery client not configured. Skipping BigQuery save.")
             return False
         
         try:
             table_id = f"{self.project_id}.{self.dataset_id}.{table_name}"
             
-            # Convert to DataFrame for easier manipulation
-            df = pd.DataFrame(patents)
+            # Prefer the Storage Write API; fall back to load jobs if it rejects the first batch
+            if self.write_client is not None and patents:
+                if self._append_with_storage_write(patents, table_name):
+                    logger.info("Successfully appended %d patents to BigQuery table: %s", len(patents), table_id)
+                    return True
+            
+            job_config = bigquery.LoadJobConfig(
+                write_disposition=bigquery.WriteDisposition.WRITE_APPEND,
+                schema_update_options=[bigquery.SchemaUpdateOption.ALLOW_FIELD_ADDITION],
+                source_format=bigquery.SourceFormat.NEWLINE_DELIMITED_JSON
+            )
+            
+            # Load rows directly as newline-delimited JSON, one job per batch
+            for start in range(0, len(patents), BIGQUERY_LOAD_BATCH_SIZE):
+                job = self.bigquery_client.load_table_from_json(
+                    patents[start:start + BIGQUERY_LOAD_BATCH_SIZE], table_id,
+                    job_config=job_config
+                )
+                job.result()  # Wait for the job to complete
+            
+            logger.info("Successfully saved %d patents to BigQuery table: %s", len(patents), table_id)
+            return True
             
-            # Load data to BigQuery
-            job = self.bigquery_client.load_table_from_dataframe(
-                df, table_id, 
+        except Exception as e:
+            logger.error("Error saving to BigQuery: %s", e)
+            return False
+    
+    def load_parquet_uri_to_bigquery(self, source_uri: str, table_name: str = 'patents') -> bool:
+        """
+        Load Parquet files already in Cloud Storage straight into BigQuery
+        
+        BigQuery reads and decodes the files itself, so no rows pass through
+        this process. The data is loaded as-is, without clean_patent_data.
+        
+        Args:
+            source_uri: gs:// URI of the Parquet file(s); wildcards are allowed
+            table_name: Name of the BigQuery table
+            
+        Returns:
+            True if successful, False otherwise
+        """
+        if not self.bigquery_client or not self.dataset_id:
+            logger.warning("BigQuery client not configured. Skipping BigQuery load.")
+            return False
+        
+        try:
+            table_id = f"{self.project_id}.{self.dataset_id}.{table_name}"
+            job = self.bigquery_client.load_table_from_uri(
+                source_uri, table_id,
                 job_config=bigquery.LoadJobConfig(
                     write_disposition=bigquery.WriteDisposition.WRITE_APPEND,
-                    schema_update_options=[bigquery.SchemaUpdateOption.ALLOW_FIELD_ADDITION]
+                    schema_update_options=[bigquery.SchemaUpdateOption.ALLOW_FIELD_ADDITION],
+                    source_format=bigquery.SourceFormat.PARQUET
                 )
             )
-            
             job.result()  # Wait for the job to complete
-            print(f"Successfully saved {len(patents)} patents to BigQuery table: {table_id}")
+            
+            logger.info("Successfully loaded %s into BigQuery table: %s", source_uri, table_id)
             return True
             
         except Exception as e:
-            print(f"Error saving to BigQuery: {e}")
+            logger.error("Error loading Parquet into BigQuery: %s", e)
+            return False
+    
+    def _append_with_storage_write(self, patents: List[Dict], table_name: str) -> bool:
+        """
+        Append patents to an existing table through the Storage Write API default stream
+        
+        Rows are sent as Arrow record batches of STORAGE_WRITE_BATCH_SIZE rows, with at
+        most STORAGE_WRITE_MAX_IN_FLIGHT requests awaiting acknowledgement.
+        
+        Args:
+            patents: List of patent dictionaries
+            table_name: Name of the BigQuery table
+            
+        Returns:
+            True once every batch is acknowledged, False if the rows do not fit
+            the table's schema, opening the stream or the first batch failed
+            (nothing has been written, so load jobs can be used instead)
+        """
+        stream = None
+        try:
+            # Everything up to the first acknowledgement can fail without writing rows:
+            # a missing table, rows that do not fit its schema or opening the stream
+            table = self._storage_write_table(patents, table_name)
+            batches = table.to_batches(max_chunksize=STORAGE_WRITE_BATCH_SIZE)
+            
+            template = bqstorage_types.AppendRowsRequest(
+                write_stream=BigQueryWriteClient.write_stream_path(
+                    self.project_id, self.dataset_id, table_name, '_default'
+                ),
+                arrow_rows=bqstorage_types.AppendRowsRequest.ArrowData(
+                    writer_schema=bqstorage_types.ArrowSchema(
+                        serialized_schema=table.schema.serialize().to_pybytes()
+                    )
+                )
+            )
+            stream = bqstorage_writer.AppendRowsStream(self.write_client, template)
+            stream.send(self._arrow_rows_request(batches[0])).result()
+            
+        except Exception as e:
+            logger.warning("Storage Write API rejected rows, using load jobs instead: %s", e)
+            if stream is not None:
+                self._close_append_stream(stream)
             return False
+        
+        try:
+            pending = deque()
+            for batch in batches[1:]:
+                pending.append(stream.send(self._arrow_rows_request(batch)))
+                if len(pending) >= STORAGE_WRITE_MAX_IN_FLIGHT:
+                    pending.popleft().result()
+            
+            for future in pending:
+                future.result()
+            return True
+            
+        finally:
+            self._close_append_stream(stream)
     
-    def save_to_json(self, patents: List[Dict], file_path: Union[str, Path]) -> bool:
+    def _storage_write_table(self, patents: List[Dict], table_name: str) -> 'pa.Table':
+        """
+        Build an Arrow table of patents typed by the destination table's schema
+        
+        The writer schema then depends only on the table, never on which values
+        happen to be present in a batch (all-null or all-empty columns included).
+        
+        Raises:
+            ValueError: If a row field has no column in the destination table
+        """
+        table_id = f"{self.project_id}.{self.dataset_id}.{table_name}"
+        fields = self.bigquery_client.get_table(table_id).schema
+        schema = pa.schema([self._arrow_field(field) for field in fields])
+        
+        rows = pa.Table.from_pylist(patents)
+        unknown = set(rows.column_names) - set(schema.names)
+        if unknown:
+            raise ValueError(f"Fields not in {table_id}: {', '.join(sorted(unknown))}")
+        
+        columns = []
+        for field in schema:
+            if field.name not in rows.column_names:
+                columns.append(pa.nulls(rows.num_rows, field.type))
+                continue
+            column = rows[field.name]
+            if pa.types.is_timestamp(field.type) and field.type.tz and pa.types.is_string(column.type):
+                # Naive ISO strings such as ingested_at are UTC
+                column = column.cast(pa.timestamp(field.type.unit))
+            columns.append(column.cast(field.type))
+        return pa.Table.from_arrays(columns, schema=schema)
+    
+    def _arrow_field(self, field: bigquery.SchemaField) -> 'pa.Field':
+        """Map a BigQuery schema field to the Arrow field the Storage Write API expects"""
+        field_type = field.field_type.upper()
+        if field_type in ('RECORD', 'STRUCT'):
+            data_type = pa.struct([self._arrow_field(subfield) for subfield in field.fields])
+        else:
+            data_type = {
+                'STRING': pa.string(),
+                'BYTES': pa.binary(),
+                'INTEGER': pa.int64(),
+                'INT64': pa.int64(),
+                'FLOAT': pa.float64(),
+                'FLOAT64': pa.float64(),
+                'NUMERIC': pa.decimal128(38, 9),
+                'BIGNUMERIC': pa.decimal256(76, 38),
+                'BOOLEAN': pa.bool_(),
+                'BOOL': pa.bool_(),
+                'TIMESTAMP': pa.timestamp('us', tz='UTC'),
+                'DATE': pa.date32(),
+                'TIME': pa.time64('us'),
+                'DATETIME': pa.timestamp('us'),
+                'GEOGRAPHY': pa.string(),
+                'JSON': pa.string(),
+            }[field_type]
+        
+        if field.mode == 'REPEATED':
+            return pa.field(field.name, pa.list_(data_type), nullable=False)
+        return pa.field(field.name, data_type, nullable=field.mode != 'REQUIRED')
+    
+    def _arrow_rows_request(self, batch: 'pa.RecordBatch') -> 'bqstorage_types.AppendRowsRequest':
+        """Wrap an Arrow record batch in an AppendRows request"""
+        return bqstorage_types.AppendRowsRequest(
+            arrow_rows=bqstorage_types.AppendRowsRequest.ArrowData(
+                rows=bqstorage_types.ArrowRecordBatch(
+                    serialized_record_batch=batch.serialize().to_pybytes(),
+                    row_count=batch.num_rows
+                )
+            )
+        )
+    
+    def _close_append_stream(self, stream: 'bqstorage_writer.AppendRowsStream'):
+        """Close an append stream, tolerating a connection that has already shut down"""
+        try:
+            stream.close()
+        except bqstorage_exceptions.StreamClosedError:
+            pass
+    
+    def save_to_json(self, patents: List[Dict], file_path: Union[str, Path], ndjson: bool = False) -> bool:
         """
         Save patent data to JSON file
         
         Args:
             patents: List of patent dictionaries
             file_path: Path where to save the JSON file
+            ndjson: Write one JSON object per line (newline-delimited JSON,
+                loadable by BigQuery) instead of an indented JSON array
             
         Returns:
             True if successful, False otherwise
@@ -246,57 +760,138 @@ class PatentIngestor:
             file_path = Path(file_path)
             file_path.parent.mkdir(parents=True, exist_ok=True)
             
-            with open(file_path, 'w', encoding='utf-8') as jsonfile:
-                json.dump(patents, jsonfile, indent=2, ensure_ascii=False)
+            if ndjson:
+                count = self._write_ndjson(patents, file_path)
+                logger.info("Successfully saved %d patents to NDJSON: %s", count, file_path)
+                return True
+            
+            if orjson is not None:
+                file_path.write_bytes(orjson.dumps(patents, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+            else:
+                with open(file_path, 'w', encoding='utf-8') as jsonfile:
+                    json.dump(patents, jsonfile, indent=2, ensure_ascii=False)
             
-            print(f"Successfully saved {len(patents)} patents to JSON: {file_path}")
+            logger.info("Successfully saved %d patents to JSON: %s", len(patents), file_path)
             return True
             
         except Exception as e:
-            print(f"Error saving to JSON: {e}")
+            logger.error("Error saving to JSON: %s", e)
             return False
+    
+    def _write_ndjson(self, patents: Iterable[Dict], file_path: Path) -> int:
+        """Stream patents to file_path one JSON line at a time, returning the row count"""
+        count = 0
+        with open(file_path, 'wb') as jsonfile:
+            for patent in patents:
+                if orjson is not None:
+                    jsonfile.write(orjson.dumps(patent, option=orjson.OPT_NON_STR_KEYS))
+                else:
+                    jsonfile.write(json.dumps(patent, ensure_ascii=False).encode('utf-8'))
+                jsonfile.write(b"\n")
+                count += 1
+        return count
 
 # Utility functions
-async def ingest_patent_batch(
-    sources: List[Dict],
-    output_format: str = 'json',
-    output_path: Optional[str] = None
-) -> List[Dict]:
+def configure_logging(level: int = logging.INFO) -> logging.handlers.QueueListener:
     """
-    Ingest patent data from multiple sources and save to specified format
+    Route this module's log records through a queue so handler I/O runs on a background thread
+    
+    Safe to call more than once: later calls only update the level and return the
+    listener created by the first call. Records stop propagating to the root logger
+    so they are not emitted twice when the root logger also has handlers.
     
     Args:
-        sources: List of source dictionaries with 'type' and 'path' or 'url'
-        output_format: 'json', 'bigquery', or 'both'
-        output_path: Path for JSON output (if applicable)
+        level: Logging level for the ingest logger
         
     Returns:
-        List of all ingested and cleaned patents
+        The started QueueListener; call stop() on it to flush pending records
     """
-    ingestor = PatentIngestor()
-    all_patents = []
+    global _log_listener
+    logger.setLevel(level)
+    if _log_listener is not None:
+        return _log_listener
+    
+    log_queue = queue.SimpleQueue()
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(logging.Formatter('%(asctime)s %(levelname)s %(name)s: %(message)s'))
     
-    for source in sources:
+    _log_listener = logging.handlers.QueueListener(log_queue, stream_handler)
+    logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    logger.propagate = False
+    _log_listener.start()
+    return _log_listener
+
+def _ingest_csv_source(ingestor: PatentIngestor, source_path: str) -> List[Dict]:
+    """Read and clean a CSV source batch by batch so the raw file is never fully in memory"""
+    cleaned_patents = []
+    for batch in ingestor.iter_from_csv(source_path, arrow=True):
+        if isinstance(batch, list):
+            cleaned_patents.extend(ingestor.clean_patent_data(batch))
+        else:
+            cleaned_patents.extend(ingestor.clean_patent_table(batch))
+    return cleaned_patents
+
+def _ingest_parquet_source(ingestor: PatentIngestor, source_path: str) -> List[Dict]:
+    """Read and clean a Parquet source one record batch at a time"""
+    cleaned_patents = []
+    for batch in ingestor.iter_from_parquet(source_path):
+        cleaned_patents.extend(ingestor.clean_patent_table(batch))
+    return cleaned_patents
+
+async def _ingest_source(ingestor: PatentIngestor, source: Dict, semaphore: asyncio.Semaphore) -> List[Dict]:
+    """Ingest and clean a single source, running blocking file work in a thread"""
+    async with semaphore:
         source_type = source.get('type')
         source_path = source.get('path') or source.get('url')
         
-        print(f"Processing source: {source_type} - {source_path}")
+        logger.info("Processing source: %s - %s", source_type, source_path)
         
         if source_type == 'csv':
-            patents = ingestor.ingest_from_csv(source_path)
+            return await asyncio.to_thread(_ingest_csv_source, ingestor, source_path)
+        elif source_type == 'parquet':
+            return await asyncio.to_thread(_ingest_parquet_source, ingestor, source_path)
         elif source_type == 'json':
-            patents = ingestor.ingest_from_json(source_path)
+            patents = await asyncio.to_thread(ingestor.ingest_from_json, source_path)
         elif source_type == 'api':
             patents = await ingestor.ingest_from_api(source_path, source.get('headers'))
         else:
-            print(f"Unknown source type: {source_type}")
-            continue
+            logger.warning("Unknown source type: %s", source_type)
+            return []
         
         # Clean the patent data
-        cleaned_patents = ingestor.clean_patent_data(patents)
-        all_patents.extend(cleaned_patents)
+        return await asyncio.to_thread(ingestor.clean_patent_data, patents)
+
+async def ingest_patent_batch(
+    sources: List[Dict],
+    output_format: str = 'json',
+    output_path: Optional[str] = None
+) -> List[Dict]:
+    """
+    Ingest patent data from multiple sources and save to specified format
+    
+    Args:
+        sources: List of source dictionaries with 'type' ('csv', 'json',
+            'parquet' or 'api') and 'path' or 'url'
+        output_format: 'json', 'bigquery', or 'both'
+        output_path: Path for JSON output (if applicable)
+        
+    Returns:
+        List of all ingested and cleaned patents
+    """
+    ingestor = PatentIngestor()
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_SOURCES)
+    
+    try:
+        # Sources are processed concurrently; results keep the order of `sources`
+        results = await asyncio.gather(
+            *(_ingest_source(ingestor, source, semaphore) for source in sources)
+        )
+    finally:
+        await ingestor.aclose()
+    
+    all_patents = [patent for patents in results for patent in patents]
     
-    print(f"Total patents ingested: {len(all_patents)}")
+    logger.info("Total patents ingested: %d", len(all_patents))
     
     # Save based on output format
     if output_format in ['json', 'both'] and output_path:
@@ -323,7 +918,9 @@ if __name__ == "__main__":
             output_path='output/processed_patents.json'
         )
         
-        print(f"Ingestion complete. Processed {len(patents)} patents.")
+        logger.info("Ingestion complete. Processed %d patents.", len(patents))
     
     # Run the example
-    # asyncio.run(main())
\ No newline at end of file
+    # listener = configure_logging()
+    # asyncio.run(main())
+    # listener.stop()
\ No newline at end of file
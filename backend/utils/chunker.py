@@ -7,9 +7,70 @@ optimized for vector embeddings and semantic search.
 
 from typing import List, Dict, Optional, Union, Tuple
 import re
+import threading
 from dataclasses import dataclass
+from functools import lru_cache
 import tiktoken
 
+# hyperscan is optional; without it section extraction uses the re module only
+try:
+    import hyperscan
+except ImportError:
+    hyperscan = None
+
+@lru_cache(maxsize=4)
+def _get_encoding(encoding_name: str) -> tiktoken.Encoding:
+    """Load a tiktoken encoding once per process and share it between chunkers"""
+    return tiktoken.get_encoding(encoding_name)
+
+# Matches the whitespace between a section header and its content
+_SECTION_GAP = re.compile(r'[\s\n]*')
+
+def _section_pattern(headers: Tuple[str, ...], terminators: Tuple[str, ...]) -> str:
+    """Build the regex capturing a section's content up to the next terminating header"""
+    end = r'\n(?:' + '|'.join(terminators) + r')|\Z' if terminators else r'\Z'
+    return r'(?:' + '|'.join(headers) + r')[\s\n]*(.*?)(?=' + end + ')'
+
+def _build_section_database(section_keywords) -> Tuple[tuple, Optional['hyperscan.Database']]:
+    """
+    Compile every section keyword into one caseless Hyperscan literal database
+    
+    Returns:
+        Tuple of (literals, database). Each literal is (section_index, is_header,
+        alternative_rank, length), indexed by Hyperscan expression id; terminators
+        include their leading newline. The database is None without hyperscan.
+    """
+    if hyperscan is None:
+        return (), None
+    
+    literals = []
+    expressions = []
+    for section_index, (_, headers, terminators) in enumerate(section_keywords):
+        for rank, keyword in enumerate(headers):
+            literals.append((section_index, True, rank, len(keyword)))
+            expressions.append(re.escape(keyword).encode('ascii'))
+        for rank, keyword in enumerate(terminators):
+            literals.append((section_index, False, rank, len(keyword) + 1))
+            expressions.append(b'\\n' + re.escape(keyword).encode('ascii'))
+    
+    database = hyperscan.Database()
+    database.compile(
+        expressions=expressions,
+        ids=list(range(len(expressions))),
+        flags=[hyperscan.HS_FLAG_CASELESS] * len(expressions)
+    )
+    return tuple(literals), database
+
+# Per-thread Hyperscan scratch space; a scratch cannot be used by two scans at once
+_scratch_local = threading.local()
+
+def _get_scratch(database: 'hyperscan.Database') -> 'hyperscan.Scratch':
+    """Return this thread's scratch space for database, allocating it on first use"""
+    scratch = getattr(_scratch_local, 'scratch', None)
+    if scratch is None:
+        scratch = _scratch_local.scratch = hyperscan.Scratch(database)
+    return scratch
+
 @dataclass
 class TextChunk:
     """Represents a chunk of text with metadata"""
@@ -26,6 +87,29 @@ class TextChunk:
 class PatentChunker:
     """Main class for chunking patent documents"""
     
+    # Header keywords for common patent sections, and the keywords that end each
+    # section when they start a line. Sections are extracted in this order.
+    _SECTION_KEYWORDS = (
+        ('abstract', ('abstract', 'summary of the invention'),
+         ('background', 'field', 'technical field', 'summary', 'brief description', 'detailed description', 'claims', 'what is claimed')),
+        ('background', ('background', 'field of the invention', 'technical field'),
+         ('summary', 'brief description', 'detailed description', 'claims', 'abstract')),
+        ('summary', ('summary', 'brief summary', 'summary of the invention'),
+         ('brief description', 'detailed description', 'claims', 'background')),
+        ('description', ('detailed description', 'description of the preferred embodiment', 'description of embodiments'),
+         ('claims', 'what is claimed')),
+        ('claims', ('claims', 'what is claimed'), ())
+    )
+    
+    # Section patterns, compiled once for all instances
+    _SECTION_PATTERNS = tuple(
+        (name, re.compile(_section_pattern(headers, terminators), re.DOTALL | re.IGNORECASE))
+        for name, headers, terminators in _SECTION_KEYWORDS
+    )
+    
+    # Hyperscan database matching every header and terminator keyword in one pass
+    _SECTION_LITERALS, _SECTION_DATABASE = _build_section_database(_SECTION_KEYWORDS)
+    
     def __init__(self, chunk_size: int = 1000, overlap: int = 200, encoding_name: str = "cl100k_base"):
         """
         Initialize the patent chunker
@@ -37,7 +121,9 @@ class PatentChunker:
         """
         self.chunk_size = chunk_size
         self.overlap = overlap
-        self.encoding = tiktoken.get_encoding(encoding_name)
+        self.encoding = _get_encoding(encoding_name)
+        # Token cost of the "\n\n" separator used when joining chunks
+        self._SEP_TOKENS = len(self.encoding.encode("\n\n"))
         
     def count_tokens(self, text: str) -> int:
         """Count the number of tokens in text"""
@@ -57,11 +143,17 @@ class PatentChunker:
         if not text.strip():
             return []
         
-        tokens = self.encoding.encode(text)
+        return self._chunk_token_array(self.encoding.encode(text), document_id)
+    
+    def _chunk_token_array(self, tokens: List[int], document_id: str = None) -> List[TextChunk]:
+        """Split an already-encoded token list into overlapping token-window chunks"""
         chunks = []
         
         start_idx = 0
         chunk_num = 0
+        # Character offset of every token in one pass; exact even when a window
+        # boundary falls inside a multi-byte character
+        text, offsets = self.encoding.decode_with_offsets(tokens)
         
         while start_idx < len(tokens):
             # Calculate end index for this chunk
@@ -72,8 +164,8 @@ class PatentChunker:
             chunk_text = self.encoding.decode(chunk_tokens)
             
             # Find character positions in original text
-            char_start = len(self.encoding.decode(tokens[:start_idx]))
-            char_end = len(self.encoding.decode(tokens[:end_idx]))
+            char_start = offsets[start_idx]
+            char_end = offsets[end_idx] if end_idx < len(tokens) else len(text)
             
             # Create chunk
             chunk_id = f"{document_id}_chunk_{chunk_num}" if document_id else f"chunk_{chunk_num}"
@@ -115,12 +207,13 @@ class PatentChunker:
         sections = self._extract_patent_sections(patent_text)
         chunks = []
         
-        for section_name, section_text in sections.items():
-            if not section_text.strip():
-                continue
-                
+        non_empty = [(name, text) for name, text in sections.items() if text.strip()]
+        # Tokenize every section in one batched call
+        token_lists = self.encoding.encode_ordinary_batch([text for _, text in non_empty])
+        
+        for (section_name, section_text), tokens in zip(non_empty, token_lists):
             # If section is small enough, keep as single chunk
-            if self.count_tokens(section_text) <= self.chunk_size:
+            if len(tokens) <= self.chunk_size:
                 chunk_id = f"{document_id}_{section_name}" if document_id else section_name
                 
                 chunk = TextChunk(
@@ -130,14 +223,14 @@ class PatentChunker:
                     chunk_id=chunk_id,
                     metadata={
                         'section_type': section_name,
-                        'token_count': self.count_tokens(section_text),
+                        'token_count': len(tokens),
                         'document_id': document_id
                     }
                 )
                 chunks.append(chunk)
             else:
                 # Split large sections into smaller chunks
-                section_chunks = self.chunk_by_tokens(section_text, f"{document_id}_{section_name}")
+                section_chunks = self._chunk_token_array(tokens, f"{document_id}_{section_name}")
                 
                 # Add section metadata to each chunk
                 for chunk in section_chunks:
@@ -160,8 +253,12 @@ class PatentChunker:
         """
         paragraphs = re.split(r'\n\s*\n', text)
         chunks = []
-        current_chunk = ""
-        current_start = 0
+        # Paragraphs of the chunk being built, with their running token count
+        buf: List[str] = []
+        buf_tokens = 0
+        buf_start = 0
+        buf_end = 0
+        cursor = 0
         chunk_num = 0
         
         for para in paragraphs:
@@ -169,69 +266,63 @@ class PatentChunker:
             if not para:
                 continue
             
+            # Locate the paragraph in the original text for offset tracking
+            para_start = text.find(para, cursor)
+            para_end = para_start + len(para)
+            cursor = para_end
+            
             para_tokens = self.count_tokens(para)
-            current_tokens = self.count_tokens(current_chunk)
             
-            # If adding this paragraph would exceed chunk size
-            if current_tokens + para_tokens > self.chunk_size and current_chunk:
-                # Save current chunk
-                chunk_id = f"{document_id}_para_{chunk_num}" if document_id else f"para_{chunk_num}"
-                
-                chunk = TextChunk(
-                    content=current_chunk.strip(),
-                    start_index=current_start,
-                    end_index=current_start + len(current_chunk),
-                    chunk_id=chunk_id,
-                    metadata={
-                        'token_count': current_tokens,
-                        'chunk_number': chunk_num,
-                        'document_id': document_id,
-                        'chunk_type': 'paragraph_based'
-                    }
-                )
-                chunks.append(chunk)
-                
-                # Start new chunk
-                current_chunk = para
-                current_start = current_start + len(chunks[-1].content) if chunks else 0
+            # If adding this paragraph would exceed chunk size, save the current chunk
+            if buf and buf_tokens + self._SEP_TOKENS + para_tokens > self.chunk_size:
+                chunks.append(self._make_paragraph_chunk(buf, buf_start, buf_end, buf_tokens, chunk_num, document_id))
                 chunk_num += 1
-                
-            else:
-                # Add paragraph to current chunk
-                if current_chunk:
-                    current_chunk += "\n\n" + para
-                else:
-                    current_chunk = para
+                buf = []
             
             # If this single paragraph is too large, split it
-            if self.count_tokens(current_chunk) > self.chunk_size:
+            if para_tokens > self.chunk_size:
                 # Split the large paragraph using token-based chunking
-                large_chunks = self.chunk_by_tokens(current_chunk, f"{document_id}_large_para_{chunk_num}")
+                large_chunks = self.chunk_by_tokens(para, f"{document_id}_large_para_{chunk_num}")
+                for chunk in large_chunks:
+                    chunk.start_index += para_start
+                    chunk.end_index += para_start
                 chunks.extend(large_chunks)
-                
-                current_chunk = ""
                 chunk_num += len(large_chunks)
+                continue
+            
+            # Add paragraph to current chunk
+            if buf:
+                buf_tokens += self._SEP_TOKENS + para_tokens
+            else:
+                buf_start = para_start
+                buf_tokens = para_tokens
+            buf.append(para)
+            buf_end = para_end
         
         # Add final chunk if any content remains
-        if current_chunk.strip():
-            chunk_id = f"{document_id}_para_{chunk_num}" if document_id else f"para_{chunk_num}"
-            
-            chunk = TextChunk(
-                content=current_chunk.strip(),
-                start_index=current_start,
-                end_index=current_start + len(current_chunk),
-                chunk_id=chunk_id,
-                metadata={
-                    'token_count': self.count_tokens(current_chunk),
-                    'chunk_number': chunk_num,
-                    'document_id': document_id,
-                    'chunk_type': 'paragraph_based'
-                }
-            )
-            chunks.append(chunk)
+        if buf:
+            chunks.append(self._make_paragraph_chunk(buf, buf_start, buf_end, buf_tokens, chunk_num, document_id))
         
         return chunks
     
+    def _make_paragraph_chunk(self, paragraphs: List[str], start_index: int, end_index: int,
+                              token_count: int, chunk_num: int, document_id: Optional[str]) -> TextChunk:
+        """Build a paragraph-based chunk from buffered paragraphs"""
+        chunk_id = f"{document_id}_para_{chunk_num}" if document_id else f"para_{chunk_num}"
+        
+        return TextChunk(
+            content="\n\n".join(paragraphs),
+            start_index=start_index,
+            end_index=end_index,
+            chunk_id=chunk_id,
+            metadata={
+                'token_count': token_count,
+                'chunk_number': chunk_num,
+                'document_id': document_id,
+                'chunk_type': 'paragraph_based'
+            }
+        )
+    
     def _extract_patent_sections(self, patent_text: str) -> Dict[str, str]:
         """
         Extract different sections from patent text
@@ -251,29 +342,95 @@ class PatentChunker:
             'other': ''
         }
         
-        # Define patterns for common patent sections
-        patterns = {
-            'abstract': r'(?i)(?:abstract|summary of the invention)[\s\n]*(.*?)(?=\n(?:background|field|technical field|summary|brief description|detailed description|claims|what is claimed)|\Z)',
-            'background': r'(?i)(?:background|field of the invention|technical field)[\s\n]*(.*?)(?=\n(?:summary|brief description|detailed description|claims|abstract)|\Z)',
-            'summary': r'(?i)(?:summary|brief summary|summary of the invention)[\s\n]*(.*?)(?=\n(?:brief description|detailed description|claims|background)|\Z)',
-            'description': r'(?i)(?:detailed description|description of the preferred embodiment|description of embodiments)[\s\n]*(.*?)(?=\n(?:claims|what is claimed)|\Z)',
-            'claims': r'(?i)(?:claims|what is claimed)[\s\n]*(.*?)(?=\Z)'
-        }
-        
-        text_remaining = patent_text
-        
-        for section_name, pattern in patterns.items():
-            match = re.search(pattern, text_remaining, re.DOTALL | re.IGNORECASE)
-            if match:
-                sections[section_name] = match.group(1).strip()
-                # Remove matched content from remaining text
-                text_remaining = re.sub(pattern, '', text_remaining, flags=re.DOTALL | re.IGNORECASE)
+        # Hyperscan matches ASCII case-insensitively, so only ASCII text gives identical results
+        if self._SECTION_DATABASE is not None and patent_text.isascii():
+            text_remaining = self._extract_sections_hyperscan(patent_text, sections)
+        else:
+            text_remaining = patent_text
+            
+            for section_name, pattern in self._SECTION_PATTERNS:
+                match = pattern.search(text_remaining)
+                if match:
+                    sections[section_name] = match.group(1).strip()
+                    # Remove matched content from remaining text
+                    text_remaining = text_remaining[:match.start()] + text_remaining[match.end():]
         
         # Any remaining text goes to 'other'
         sections['other'] = text_remaining.strip()
         
         return sections
 
+    def _extract_sections_hyperscan(self, patent_text: str, sections: Dict[str, str]) -> str:
+        """
+        Fill sections from a single Hyperscan pass, mirroring _SECTION_PATTERNS
+        
+        Each section starts at the leftmost remaining header keyword (the first listed
+        keyword wins a tie) and ends at the first terminator after its leading
+        whitespace. Removing a section cannot create new keyword matches because
+        every removed span is followed by a newline or the end of the text, so the
+        offsets found up front only need to be dropped or shifted.
+        
+        Args:
+            patent_text: Full patent document text (ASCII only)
+            sections: Dictionary to fill with section content
+            
+        Returns:
+            Text left over after every matched section is removed
+        """
+        literals = self._SECTION_LITERALS
+        hits = []
+        
+        def on_match(expr_id, _from, to, _flags, _context):
+            hits.append((to - literals[expr_id][3], to, expr_id))
+        
+        self._SECTION_DATABASE.scan(
+            patent_text.encode('ascii'),
+            match_event_handler=on_match,
+            scratch=_get_scratch(self._SECTION_DATABASE)
+        )
+        
+        text_remaining = patent_text
+        
+        for section_index, (section_name, _, _) in enumerate(self._SECTION_KEYWORDS):
+            headers = [
+                (start, literals[expr_id][2], end) for start, end, expr_id in hits
+                if literals[expr_id][0] == section_index and literals[expr_id][1]
+            ]
+            if not headers:
+                continue
+            
+            match_start, _, header_end = min(headers)
+            content_start = _SECTION_GAP.match(text_remaining, header_end).end()
+            match_end = min(
+                (start for start, _, expr_id in hits
+                 if literals[expr_id][0] == section_index and not literals[expr_id][1] and start >= content_start),
+                default=len(text_remaining)
+            )
+            
+            sections[section_name] = text_remaining[content_start:match_end].strip()
+            # Remove matched content from remaining text
+            text_remaining = text_remaining[:match_start] + text_remaining[match_end:]
+            
+            # Drop hits inside the removed span and shift those after it
+            removed = match_end - match_start
+            hits = [
+                (start - removed, end - removed, expr_id) if start >= match_end else (start, end, expr_id)
+                for start, end, expr_id in hits
+                if end <= match_start or start >= match_end
+            ]
+        
+        return text_remaining
+
+# Shared chunker for helpers that only need token counting with default settings
+_DEFAULT_CHUNKER: Optional[PatentChunker] = None
+
+def _get_default_chunker() -> PatentChunker:
+    """Return the shared default PatentChunker, creating it on first use"""
+    global _DEFAULT_CHUNKER
+    if _DEFAULT_CHUNKER is None:
+        _DEFAULT_CHUNKER = PatentChunker()
+    return _DEFAULT_CHUNKER
+
 # Utility functions
 def chunk_patent_document(
     patent_text: str,
@@ -318,19 +475,21 @@ def optimize_chunks_for_embeddings(chunks: List[TextChunk], min_size: int = 100)
     Returns:
         Optimized list of TextChunk objects
     """
-    chunker = PatentChunker()
+    chunker = _get_default_chunker()
     optimized_chunks = []
     
     i = 0
     while i < len(chunks):
         current_chunk = chunks[i]
-        current_tokens = chunker.count_tokens(current_chunk.content)
+        # Reuse the token count recorded at chunking time when available
+        current_tokens = current_chunk.metadata.get('token_count') or chunker.count_tokens(current_chunk.content)
         
         # If chunk is too small, try to combine with next chunk
         if current_tokens < min_size and i < len(chunks) - 1:
             next_chunk = chunks[i + 1]
+            next_tokens = next_chunk.metadata.get('token_count') or chunker.count_tokens(next_chunk.content)
             combined_content = current_chunk.content + "\n\n" + next_chunk.content
-            combined_tokens = chunker.count_tokens(combined_content)
+            combined_tokens = current_tokens + next_tokens + chunker._SEP_TOKENS
             
             # If combined chunk is reasonable size, combine them
             if combined_tokens <= chunker.chunk_size: